@@ -1,11 +1,5 @@
-import sys
-
-if sys.version_info.major >= 3 and sys.version_info.minor > 10:
-    from collections.abc import Iterable
-else:
-    from collections import Iterable
-
 from collections import defaultdict, OrderedDict
+from collections.abc import Iterable
 
 
 def inverse_dicts(*dicts):
@@ -6,6 +6,9 @@ from functools import lru_cache
 from coala_utils.decorators import yield_once
 from coalib.misc.Constants import GLOBBING_SPECIAL_CHARS
 
+_GLOB_ESCAPE_TABLE = str.maketrans(
+    {char: '[' + char + ']' for char in GLOBBING_SPECIAL_CHARS})
+
 
 def _end_of_set_index(string, start_index):
     """
@@ -47,8 +50,7 @@ def glob_escape(input_string):
     :return:             Escaped string in which all the special glob characters
                          ``()[]|?*`` are escaped.
     """
-    return re.sub('(?P<char>[' + re.escape(GLOBBING_SPECIAL_CHARS) + '])',
-                  '[\\g<char>]', input_string)
+    return input_string.translate(_GLOB_ESCAPE_TABLE)
 
 
 def _position_is_bracketed(string, position):
@@ -1,22 +1,58 @@
 import sys, os
 
-if sys.version_info.major >= 3 and sys.version_info.minor > 10:
-    from collections.abc import Iterable
-else:
-    from collections import Iterable
-
 from collections import OrderedDict
+from collections.abc import Iterable
 
-from coala_utils.decorators import (
-    enforce_signature,
-    generate_repr,
-)
+from cached_property import cached_property
+from coala_utils.decorators import generate_repr
 from coala_utils.string_processing.StringConverter import StringConverter
 from coalib.bearlib.languages.Language import Language, UnknownLanguageError
+from coalib.misc.Constants import GLOBBING_SPECIAL_CHARS
 from coalib.parsing.Globbing import glob_escape
 from coalib.results.SourcePosition import SourcePosition
 
 
+def _glob_escape_if_needed(string):
+    """
+    Escapes the given string with ``glob_escape`` only if it contains any
+    special glob characters, otherwise it is returned as is.
+
+    Each ``in`` test is a single native scan over the string that allocates
+    nothing, while ``glob_escape`` always builds a new string through
+    ``str.translate``. For the common case of paths without any special glob
+    characters the scans are cheaper.
+
+    :param string: The string to escape.
+    :return:       The escaped string.
+    """
+    if any(char in string for char in GLOBBING_SPECIAL_CHARS):
+        return glob_escape(string)
+    return string
+
+
+def _absolute_paths(origin_dir, paths):
+    """
+    Creates an absolute path out of each of the given paths, joining relative
+    ones to the given origin directory.
+
+    :param origin_dir: The absolute directory relative paths are based on.
+    :param paths:      An iterable of paths.
+    :return:           A tuple of normalized absolute paths.
+    """
+    # Bind the ``os.path`` functions locally as this runs once per element of
+    # potentially long file and glob lists.
+    isabs = os.path.isabs
+    join = os.path.join
+    normpath = os.path.normpath
+
+    result = []
+    for elem in paths:
+        strrep = str(elem).strip()
+        result.append(strrep if isabs(strrep)
+                      else normpath(join(origin_dir, strrep)))
+    return tuple(result)
+
+
 def path(obj, *args, **kwargs):
     return obj.__path__(*args, **kwargs)
 
@@ -42,11 +78,11 @@ def glob(obj, *args, **kwargs):
 
 def glob_list(obj, *args, **kwargs):
     """
-    Creates a list of paths in which all special glob characters in all the
+    Creates a tuple of paths in which all special glob characters in all the
     parent directories of all paths in the given setting are properly escaped.
 
     :param obj: The ``Setting`` object from which the key is obtained.
-    :return:    Returns a list of paths in which special glob characters are
+    :return:    Returns a tuple of paths in which special glob characters are
                 escaped.
     """
     return obj.__glob_list__(*args, **kwargs)
@@ -66,6 +102,50 @@ def language(name):
         raise ValueError(e)
 
 
+# Conversions of plain strings which yield the same result as applying the
+# builtin to a ``StringConverter`` wrapping the string, as long as the string
+# contains no backslash (so unescaping it is a no-op).
+_FAST_CONVERSIONS = {
+    str: str.strip,
+    int: int,
+    float: float,
+}
+
+
+def _fast_conversion(conversion_func):
+    """
+    Looks up the fast conversion for the given conversion function.
+
+    :param conversion_func: The conversion function.
+    :return:                The matching conversion of ``_FAST_CONVERSIONS``
+                            or ``None`` if there is none.
+    """
+    if isinstance(conversion_func, type):
+        return _FAST_CONVERSIONS.get(conversion_func)
+    return None
+
+
+def _string_conversion(conversion_func):
+    """
+    Creates a function that converts a single string the same way as applying
+    the given conversion function to a ``StringConverter`` of that string.
+
+    For the builtins in ``_FAST_CONVERSIONS`` the ``StringConverter`` is only
+    created for strings containing backslashes and for non-string values.
+
+    :param conversion_func: The conversion function that converts a
+                            ``StringConverter`` into your desired object.
+    :return:                The string conversion function.
+    """
+    fast_conversion = _fast_conversion(conversion_func)
+    if fast_conversion is None:
+        return lambda value: conversion_func(StringConverter(value))
+
+    return lambda value: (fast_conversion(value)
+                          if type(value) is str and '\\' not in value
+                          else conversion_func(StringConverter(value)))
+
+
 def typed_list(conversion_func):
     """
     Creates a class that converts a setting into a list of elements each
@@ -75,18 +155,23 @@ def typed_list(conversion_func):
                             your desired list item object.
     :return:                An instance of the created conversion class.
     """
+    convert = _string_conversion(conversion_func)
 
     class Converter:
 
-        def __call__(self, setting):
-            return [conversion_func(StringConverter(elem))
-                    for elem in setting]
+        __slots__ = ('_repr',)
 
-        def __repr__(self):
-            return (
+        def __init__(self):
+            self._repr = (
                 f'typed_list({conversion_func.__name__}) at ({hex(id(self))})'
             )
 
+        def __call__(self, setting):
+            return [convert(elem) for elem in setting]
+
+        def __repr__(self):
+            return self._repr
+
     return Converter()
 
 
@@ -112,27 +197,46 @@ def typed_dict(key_type, value_type, default):
     :return:           An instance of the created conversion class.
     """
 
+    convert_key = _string_conversion(key_type)
+    convert_value = _string_conversion(value_type)
+
     class Converter:
 
-        def __call__(self, setting):
-            return {key_type(StringConverter(key)):
-                    value_type(StringConverter(value))
-                    if value != '' else default
-                    for key, value in dict(setting).items()}
+        __slots__ = ('_repr',)
 
-        def __repr__(self):
-            return (
+        def __init__(self):
+            self._repr = (
                 f'typed_dict({key_type.__name__}, {value_type.__name__}, ' +
                 f'default={default}) at ({hex(id(self))})'
             )
 
+        def __call__(self, setting):
+            if not hasattr(setting, 'keys'):
+                setting = dict(setting)
+
+            result = {}
+            for key in setting.keys():
+                value = setting[key]
+                result[convert_key(key)] = (convert_value(value)
+                                            if value != '' else default)
+            return result
+
+        def __repr__(self):
+            return self._repr
+
     return Converter()
 
 
+# Plain dicts keep their insertion order since Python 3.7 and are cheaper to
+# build and iterate than ``OrderedDict``.
+_ORDERED_DICT = dict if sys.version_info >= (3, 7) else OrderedDict
+
+
 def typed_ordered_dict(key_type, value_type, default):
     """
     Creates a class that converts a setting into an ordered dict with the
-    given types.
+    given types. On Python 3.7 and later this is a plain ``dict``, which keeps
+    insertion order too.
 
     :param key_type:   The type conversion function for the keys.
     :param value_type: The type conversion function for the values.
@@ -140,21 +244,34 @@ def typed_ordered_dict(key_type, value_type, default):
     :return:           An instance of the created conversion class.
     """
 
+    convert_key = _string_conversion(key_type)
+    convert_value = _string_conversion(value_type)
+
     class Converter:
 
-        def __call__(self, setting):
-            return OrderedDict((key_type(StringConverter(key)),
-                                value_type(StringConverter(value))
-                                if value != '' else default)
-                               for key, value in OrderedDict(setting).items())
+        __slots__ = ('_repr',)
 
-        def __repr__(self):
-            return (
+        def __init__(self):
+            self._repr = (
                 f'typed_ordered_dict({key_type.__name__}, ' +
                 f'{value_type.__name__}, default={default}) ' +
                 f'at ({hex(id(self))})'
             )
 
+        def __call__(self, setting):
+            if not hasattr(setting, 'keys'):
+                setting = _ORDERED_DICT(setting)
+
+            result = _ORDERED_DICT()
+            for key in setting.keys():
+                value = setting[key]
+                result[convert_key(key)] = (convert_value(value)
+                                            if value != '' else default)
+            return result
+
+        def __repr__(self):
+            return self._repr
+
     return Converter()
 
 
@@ -165,7 +282,6 @@ class Setting(StringConverter):
     conversions into common data types.
     """
 
-    @enforce_signature
     def __init__(self,
                  key,
                  value,
@@ -198,7 +314,31 @@ class Setting(StringConverter):
         :param to_append:                  The boolean value if setting value
                                            needs to be appended to a setting in
                                            the defaults of a section.
+        :raises TypeError:                 If any of the annotated arguments
+                                           has a wrong type.
         """
+        # Settings are created in large numbers while parsing, so the argument
+        # types are checked inline instead of using ``enforce_signature``.
+        if not isinstance(origin, (str, SourcePosition)):
+            raise TypeError('origin must be a str or SourcePosition '
+                            f'(provided value: {origin!r})')
+        if not isinstance(strip_whitespaces, bool):
+            raise TypeError('strip_whitespaces must be a bool '
+                            f'(provided value: {strip_whitespaces!r})')
+        if not isinstance(list_delimiters, Iterable):
+            raise TypeError('list_delimiters must be an Iterable '
+                            f'(provided value: {list_delimiters!r})')
+        if not isinstance(from_cli, bool):
+            raise TypeError('from_cli must be a bool '
+                            f'(provided value: {from_cli!r})')
+        if not isinstance(remove_empty_iter_elements, bool):
+            raise TypeError('remove_empty_iter_elements must be a bool '
+                            '(provided value: '
+                            f'{remove_empty_iter_elements!r})')
+        if not isinstance(to_append, bool):
+            raise TypeError('to_append must be a bool '
+                            f'(provided value: {to_append!r})')
+
         self.to_append = to_append
 
         StringConverter.__init__(
@@ -211,8 +351,37 @@ class Setting(StringConverter):
         self.from_cli = from_cli
         self.key = key
         self._origin = origin
+        # The type of the origin never changes, so check it only once here
+        # instead of on every access of the origin related properties.
+        self._origin_is_position = isinstance(origin, SourcePosition)
+        self._origin_abs_dir = None
+        self._origin_glob_abs_dir = None
         self.length = 1
 
+    def _get_origin_abs_dir(self, glob_escape_origin=False):
+        """
+        Returns the absolute directory of the origin of this setting. The
+        result is memoized as the origin doesn't change after construction.
+
+        :param glob_escape_origin: Whether to return the directory escaped
+                                   with ``glob_escape``.
+        :return:                   The absolute directory of the origin.
+        """
+        if self._origin_abs_dir is None:
+            # We need to get full path before escaping since the full path
+            # may introduce unintended glob characters
+            self._origin_abs_dir = os.path.abspath(
+                os.path.dirname(self.origin))
+
+        if not glob_escape_origin:
+            return self._origin_abs_dir
+
+        if self._origin_glob_abs_dir is None:
+            self._origin_glob_abs_dir = _glob_escape_if_needed(
+                self._origin_abs_dir)
+
+        return self._origin_glob_abs_dir
+
     def __path__(self, origin=None, glob_escape_origin=False):
         """
         Determines the path of this setting.
@@ -231,22 +400,24 @@ class Setting(StringConverter):
         :raises ValueError:        If no origin is specified in the setting
                                    nor the given origin parameter.
         """
-        strrep = str(self).strip()
+        # This may be called on plain strings too, see the note above.
+        is_setting = isinstance(self, Setting)
+
+        strrep = self._stripped_str if is_setting else str(self).strip()
         if os.path.isabs(strrep):
             return strrep
 
-        if hasattr(self, 'origin') and self.origin != '':
-            origin = self.origin
-
-        if origin is None:
+        if is_setting and self.origin:
+            origin = self._get_origin_abs_dir(glob_escape_origin)
+        elif origin is None:
             raise ValueError('Cannot determine path without origin.')
+        else:
+            # We need to get full path before escaping since the full path
+            # may introduce unintended glob characters
+            origin = os.path.abspath(os.path.dirname(origin))
 
-        # We need to get full path before escaping since the full path
-        # may introduce unintended glob characters
-        origin = os.path.abspath(os.path.dirname(origin))
-
-        if glob_escape_origin:
-            origin = glob_escape(origin)
+            if glob_escape_origin:
+                origin = _glob_escape_if_needed(origin)
 
         return os.path.normpath(os.path.join(origin, strrep))
 
@@ -271,19 +442,19 @@ class Setting(StringConverter):
         Splits the value into a list and creates a path out of each item taking
         the origin of the setting into account.
 
-        :return: A list of absolute paths.
+        :return: A tuple of absolute paths.
         """
-        return [Setting.__path__(elem, self.origin) for elem in self]
+        return self._path_tuple
 
     def __glob_list__(self):
         """
         Splits the value into a list and creates a path out of each item in
         which the special glob characters in origin are escaped.
 
-        :return: A list of absolute paths in which the special characters in
+        :return: A tuple of absolute paths in which the special characters in
                  the parent directories of the setting are escaped.
         """
-        return [Setting.__glob__(elem, self.origin) for elem in self]
+        return self._glob_tuple
 
     def __iter__(self, remove_backslashes=True):
         if self.to_append:
@@ -312,19 +483,52 @@ class Setting(StringConverter):
                              'setting in a section to get the complete value.')
         return self._value
 
+    @value.setter
+    def value(self, newval):
+        StringConverter.value.fset(self, newval)
+        for cached in ('_stripped_str', '_path_tuple', '_glob_tuple'):
+            self.__dict__.pop(cached, None)
+
+    @cached_property
+    def _stripped_str(self):
+        """
+        :return:
+            The string representation of the value with surrounding
+            whitespace removed.
+        """
+        return str(self).strip()
+
+    @cached_property
+    def _path_tuple(self):
+        """
+        :return:
+            The result of ``__path_list__``. As a tuple it can't be modified
+            by callers and is safe to reuse until the value changes.
+        """
+        return _absolute_paths(self._get_origin_abs_dir(), self)
+
+    @cached_property
+    def _glob_tuple(self):
+        """
+        :return:
+            The result of ``__glob_list__``, see ``_path_tuple``.
+        """
+        return _absolute_paths(
+            self._get_origin_abs_dir(glob_escape_origin=True), self)
+
     @property
     def origin(self):
         """
         Returns the filename.
         """
-        if isinstance(self._origin, SourcePosition):
+        if self._origin_is_position:
             return self._origin.filename
         else:
             return self._origin
 
     @property
     def line_number(self):
-        if isinstance(self._origin, SourcePosition):
+        if self._origin_is_position:
             return self._origin.line
         else:
             raise TypeError("Instantiated with str 'origin' "
@@ -333,7 +537,7 @@ class Setting(StringConverter):
 
     @property
     def end_line_number(self):
-        if isinstance(self._origin, SourcePosition):
+        if self._origin_is_position:
             return self.length + self._origin.line - 1
         else:
             raise TypeError("Instantiated with str 'origin' "
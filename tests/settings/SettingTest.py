@@ -23,6 +23,11 @@ class SettingTest(unittest.TestCase):
                                Setting, '', '', '', to_append=10)
         self.assertRaises(TypeError, Setting, 'a', 'b', list_delimiters=5)
         self.assertRaises(TypeError, Setting, 'a', 'b', list_delimiters=None)
+        self.assertRaisesRegex(TypeError, 'strip_whitespaces',
+                               Setting, 'a', 'b', strip_whitespaces='yes')
+        self.assertRaisesRegex(TypeError, 'remove_empty_iter_elements',
+                               Setting, 'a', 'b',
+                               remove_empty_iter_elements=None)
 
     def test_empty_key(self):
         with self.assertRaisesRegex(
@@ -51,6 +56,25 @@ class SettingTest(unittest.TestCase):
         self.assertEqual(path(self.uut),
                          os.path.abspath(os.path.join('.', '22')))
 
+    def test_path_value_changed(self):
+        self.uut = Setting('key', '22', '.' + os.path.sep)
+        self.assertEqual(path(self.uut),
+                         os.path.abspath(os.path.join('.', '22')))
+
+        self.uut.value = '23'
+        self.assertEqual(path(self.uut),
+                         os.path.abspath(os.path.join('.', '23')))
+
+    def test_path_normalization(self):
+        origin = os.path.join('test', 'somefile')
+        for value, expected in (('a', 'a'),
+                                ('a/b/', 'a/b'),
+                                ('./a/../b', 'b'),
+                                ('..', '..')):
+            self.uut = Setting('key', value, origin)
+            self.assertEqual(path(self.uut),
+                             os.path.abspath(os.path.join('test', expected)))
+
     def test_glob(self):
         self.uut = Setting('key', '.',
                            origin=os.path.join('test (1)', 'somefile'))
@@ -63,19 +87,42 @@ class SettingTest(unittest.TestCase):
         self.assertEqual(glob(self.uut),
                          glob_escape(os.path.abspath('test (1)')))
 
+    def test_glob_string(self):
+        self.assertEqual(
+            Setting.__glob__('x', os.path.join('test (1)', 'f')),
+            os.path.join(glob_escape(os.path.abspath('test (1)')), 'x'))
+        self.assertEqual(Setting.__glob__('x', os.path.join('test', 'f')),
+                         os.path.abspath(os.path.join('test', 'x')))
+
+    def test_glob_repeated(self):
+        self.uut = Setting('key', 'x',
+                           origin=os.path.join('test (1)', 'somefile'))
+        expected = os.path.join(glob_escape(os.path.abspath('test (1)')), 'x')
+        self.assertEqual(glob(self.uut), expected)
+        self.assertEqual(glob(self.uut), expected)
+
     def test_path_list(self):
         abspath = os.path.abspath('.')
         # Need to escape backslashes since we use list conversion
         self.uut = Setting('key', '., ' + abspath.replace('\\', '\\\\'),
                            origin=os.path.join('test', 'somefile'))
         self.assertEqual(path_list(self.uut),
-                         [os.path.abspath(os.path.join('test', '.')), abspath])
+                         (os.path.abspath(os.path.join('test', '.')), abspath))
 
         self.uut = Setting('key', '., ' + abspath.replace('\\', '\\\\'),
                            origin=SourcePosition(
                                   os.path.join('test', 'somefile')))
         self.assertEqual(path_list(self.uut),
-                         [os.path.abspath(os.path.join('test', '.')), abspath])
+                         (os.path.abspath(os.path.join('test', '.')), abspath))
+
+    def test_path_list_value_changed(self):
+        self.uut = Setting('key', 'a, b', origin=os.path.join('test', 'f'))
+        paths = path_list(self.uut)
+        self.assertIs(path_list(self.uut), paths)
+
+        self.uut.value = 'c'
+        self.assertEqual(path_list(self.uut),
+                         (os.path.abspath(os.path.join('test', 'c')),))
 
     def test_url(self):
         uut = Setting('key', 'http://google.com')
@@ -92,15 +139,16 @@ class SettingTest(unittest.TestCase):
                            origin=os.path.join('test (1)', 'somefile'))
         self.assertEqual(
             glob_list(self.uut),
-            [glob_escape(os.path.abspath(os.path.join('test (1)', '.'))),
-             abspath])
+            (glob_escape(os.path.abspath(os.path.join('test (1)', '.'))),
+             abspath))
 
         self.uut = Setting('key', '.,' + abspath.replace('\\', '\\\\'),
                            origin=SourcePosition(
                                   os.path.join('test (1)', 'somefile')))
         self.assertEqual(glob_list(self.uut),
-                         [glob_escape(os.path.abspath(
-                                      os.path.join('test (1)', '.'))), abspath])
+                         (glob_escape(os.path.abspath(
+                                      os.path.join('test (1)', '.'))),
+                          abspath))
 
     def test_language(self):
         self.uut = Setting('key', 'python 3.4')
@@ -128,6 +176,15 @@ class SettingTest(unittest.TestCase):
         self.assertRegex(repr(typed_list(int)),
                          'typed_list\\(int\\) at \\(0x[a-fA-F0-9]+\\)')
 
+    def test_typed_list_custom_conversion(self):
+        self.uut = Setting('key', 'a, b')
+        self.assertEqual(typed_list(lambda elem: str(elem) * 2)(self.uut),
+                         ['aa', 'bb'])
+
+    def test_typed_list_non_string_elements(self):
+        self.assertEqual(str_list([1, 2]), ['1', '2'])
+        self.assertEqual(int_list([1, 2]), [1, 2])
+
     def test_int_list(self):
         self.uut = Setting('key', '1, 2, 3')
         self.assertEqual(int_list(self.uut), [1, 2, 3])
@@ -145,6 +202,13 @@ class SettingTest(unittest.TestCase):
         self.assertRegex(
             repr(str_list), 'typed_list\\(str\\) at \\(0x[a-fA-F0-9]+\\)')
 
+    def test_typed_list_escaped_elements(self):
+        self.uut = Setting('key', ' a , \\\\b', strip_whitespaces=False)
+        self.assertEqual(str_list(self.uut), ['a', 'b'])
+
+        self.uut = Setting('key', '1, \\\\2')
+        self.assertEqual(int_list(self.uut), [1, 2])
+
     def test_float_list(self):
         self.uut = Setting('key', '0.8, 1.3, 5.87')
         self.assertEqual(float_list(self.uut), [0.8, 1.3, 5.87])
@@ -181,10 +245,26 @@ class SettingTest(unittest.TestCase):
             'typed_dict\\(int, str, default=None\\) at \\(0x[a-fA-F0-9]+\\)'
         )
 
+    def test_typed_dict_custom_conversion(self):
+        self.uut = Setting('key', 'a: yes, b')
+        self.assertEqual(typed_dict(str, bool, None)(self.uut),
+                         {'a': True, 'b': None})
+        self.assertEqual(typed_ordered_dict(str, bool, None)(self.uut),
+                         OrderedDict([('a', True), ('b', None)]))
+
+    def test_typed_dict_plain_inputs(self):
+        self.assertEqual(typed_dict(str, int, 0)([('a', '1')]), {'a': 1})
+        self.assertEqual(typed_dict(str, int, 0)({'a': 1}), {'a': 1})
+        self.assertEqual(typed_ordered_dict(str, int, 0)([('a', '1')]),
+                         OrderedDict([('a', 1)]))
+
     def test_typed_ordered_dict(self):
         self.uut = Setting('key', '1, 2: t, 3')
         self.assertEqual(typed_ordered_dict(int, str, None)(self.uut),
                          OrderedDict([(1, None), (2, 't'), (3, None)]))
+        self.assertEqual(
+            list(typed_ordered_dict(int, str, None)(self.uut).items()),
+            [(1, None), (2, 't'), (3, None)])
 
         with self.assertRaises(ValueError):
             self.uut = Setting('key', '1, a, 3')